@@ -1,8 +1,9 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 import os
-from typing import Dict, Any
+from typing import AsyncIterator, Dict, Any
 
 # Fix imports - add path setup 
 import sys
@@ -12,13 +13,21 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from app.routes import auth, costs, health, cloud_accounts
 from app.middleware.logging import LoggingMiddleware
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Close pooled connections to downstream services on shutdown."""
+    yield
+    await costs.service_client.aclose()
+    await health.service_client.aclose()
+
 # Application metadata
 app = FastAPI(
     title="CostWatch API Gateway",
     description="Smart cloud cost optimization platform API",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # CORS middleware - configure based on environment
@@ -132,8 +132,7 @@ async def check_services_health(
     current_user: str = Depends(bypass_auth_for_testing)
 ) -> Dict[str, Any]:
     """Check health of all dependent services."""
-    scanner_healthy = await service_client.health_check_scanner()
-    cost_healthy = await service_client.health_check_cost_service()
+    scanner_healthy, cost_healthy = await service_client.health_check_all()
 
     return {
         "timestamp": datetime.utcnow().isoformat(),
@@ -22,8 +22,7 @@ async def health_check() -> Dict[str, str]:
 @router.get("/ready")
 async def readiness_check() -> Dict[str, Any]:
     """Check if gateway and downstream services are ready."""
-    scanner_healthy = await service_client.health_check_scanner()
-    cost_healthy = await service_client.health_check_cost_service()
+    scanner_healthy, cost_healthy = await service_client.health_check_all()
 
     all_healthy = scanner_healthy and cost_healthy
 
@@ -1,10 +1,23 @@
+import asyncio
 import httpx
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import os
+import time
 
 logger = logging.getLogger(__name__)
 
+# Seconds a downstream health result is reused before checking again
+HEALTH_CACHE_TTL = 2.0
+
+# Health URL -> (monotonic time checked, healthy); shared by all clients
+_health_cache: Dict[str, Tuple[float, bool]] = {}
+
+
+def invalidate_health_cache() -> None:
+    """Forget cached health results so the next check hits the services."""
+    _health_cache.clear()
+
 
 class ServiceClient:
     """Client for communicating with other microservices."""
@@ -19,34 +32,65 @@ class ServiceClient:
             'http://cost-service:8001'
         )
         self.timeout = 30.0
+        self._client: Optional[httpx.AsyncClient] = None
 
-    async def scan_all_resources(
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use.
+
+        Reusing one client keeps keep-alive connections to the downstream
+        services open instead of reconnecting on every call.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _post_json(
         self,
-        regions: list = None,
-        include_costs: bool = True
+        service_name: str,
+        url: str,
+        data: Dict[str, Any]
     ) -> Optional[Dict[str, Any]]:
-        """Trigger resource scan via Resource Scanner service."""
+        """POST data to a downstream service; return the JSON body or None on failure."""
         try:
-            data = {
-                'regions': regions or ['us-west-2'],
-                'include_costs': include_costs
-            }
-
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.resource_scanner_url}/scan/all",
-                    json=data
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await self._get_client().post(url, json=data)
+            response.raise_for_status()
+            return response.json()
 
         except httpx.RequestError as e:
-            logger.error(f"Failed to communicate with Resource Scanner: {e}")
+            logger.error(f"Failed to communicate with {service_name}: {e}")
             return None
         except httpx.HTTPStatusError as e:
-            logger.error(f"Resource Scanner returned error {e.response.status_code}")
+            logger.error(f"{service_name} returned error {e.response.status_code}")
+            return None
+        except Exception as e:
+            logger.error(f"Invalid response from {service_name}: {e}")
             return None
 
+    async def scan_all_resources(
+        self,
+        regions: list = None,
+        include_costs: bool = True
+    ) -> Optional[Dict[str, Any]]:
+        """Trigger resource scan via Resource Scanner service."""
+        data = {
+            'regions': regions or ['us-west-2'],
+            'include_costs': include_costs
+        }
+        return await self._post_json(
+            'Resource Scanner',
+            f"{self.resource_scanner_url}/scan/all",
+            data
+        )
+
     async def analyze_costs(
         self,
         account_id: str,
@@ -54,39 +98,45 @@ class ServiceClient:
         end_date: str
     ) -> Optional[Dict[str, Any]]:
         """Get cost analysis from cost-service."""
+        data = {
+            'account_id': account_id,
+            'start_date': start_date,
+            'end_date': end_date
+        }
+        return await self._post_json(
+            'Cost Service',
+            f"{self.cost_service_url}/analyze/costs",
+            data
+        )
+
+    async def _check_health(self, url: str) -> bool:
+        """Check a health endpoint, reusing results younger than HEALTH_CACHE_TTL."""
+        cached = _health_cache.get(url)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < HEALTH_CACHE_TTL:
+            return cached[1]
+
         try:
-            data = {
-                'account_id': account_id,
-                'start_date': start_date,
-                'end_date': end_date
-            }
-
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.cost_service_url}/analyze/costs",
-                    json=data
-                )
-                response.raise_for_status()
-                return response.json()
+            response = await self._get_client().get(url, timeout=5.0)
+            healthy = response.status_code == 200
+        except Exception:
+            healthy = False
 
-        except Exception as e:
-            logger.error(f"Failed to get cost analysis: {e}")
-            return None
+        _health_cache[url] = (now, healthy)
+        return healthy
 
     async def health_check_scanner(self) -> bool:
         """Check if Resource Scanner is healthy."""
-        try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.resource_scanner_url}/health")
-                return response.status_code == 200
-        except Exception:
-            return False
+        return await self._check_health(f"{self.resource_scanner_url}/health")
 
     async def health_check_cost_service(self) -> bool:
         """Check if Cost Service is healthy."""
-        try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.cost_service_url}/health")
-                return response.status_code == 200
-        except Exception:
-            return False
+        return await self._check_health(f"{self.cost_service_url}/health")
+
+    async def health_check_all(self) -> Tuple[bool, bool]:
+        """Check Resource Scanner and Cost Service health concurrently."""
+        scanner_healthy, cost_healthy = await asyncio.gather(
+            self.health_check_scanner(),
+            self.health_check_cost_service()
+        )
+        return scanner_healthy, cost_healthy
@@ -5,6 +5,17 @@ from datetime import datetime
 from typing import Optional
 import re
 
+# AWS account IDs are 12-digit numbers
+ACCOUNT_ID_PATTERN = re.compile(r'^\d{12}$')
+
+# Basic AWS region pattern: us-west-2, eu-central-1, etc.
+REGION_PATTERN = re.compile(r'^[a-z]{2}-[a-z]+-\d{1}$')
+
+VALID_RESOURCE_TYPES = frozenset({
+    'ec2', 'rds', 's3', 'ebs', 'lambda',
+    'dynamodb', 'cloudwatch', 'vpc', 'elb'
+})
+
 
 def validate_aws_account_id(account_id: str) -> bool:
     """
@@ -19,8 +30,7 @@ def validate_aws_account_id(account_id: str) -> bool:
     if not account_id:
         return False
 
-    # AWS account IDs are 12-digit numbers
-    return bool(re.match(r'^\d{12}$', account_id))
+    return bool(ACCOUNT_ID_PATTERN.match(account_id))
 
 
 def validate_date_format(date_str: str) -> bool:
@@ -81,9 +91,7 @@ def validate_region(region: str) -> bool:
     Returns:
         bool: True if valid, False otherwise
     """
-    # Basic AWS region pattern: us-west-2, eu-central-1, etc.
-    pattern = r'^[a-z]{2}-[a-z]+-\d{1}$'
-    return bool(re.match(pattern, region))
+    return bool(REGION_PATTERN.match(region))
 
 
 def validate_resource_type(resource_type: str) -> bool:
@@ -96,11 +104,7 @@ def validate_resource_type(resource_type: str) -> bool:
     Returns:
         bool: True if valid, False otherwise
     """
-    valid_types = {
-        'ec2', 'rds', 's3', 'ebs', 'lambda',
-        'dynamodb', 'cloudwatch', 'vpc', 'elb'
-    }
-    return resource_type.lower() in valid_types
+    return resource_type.lower() in VALID_RESOURCE_TYPES
 
 
 def sanitize_string(input_str: str, max_length: int = 255) -> str:
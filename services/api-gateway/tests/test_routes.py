@@ -0,0 +1,72 @@
+import asyncio
+import httpx
+from unittest.mock import AsyncMock, patch
+from fastapi.testclient import TestClient
+from app.main import app
+from app.routes import costs, health
+from app.utils.service_client import ServiceClient, invalidate_health_cache
+
+def test_service_client_reuses_http_client():
+    """Test ServiceClient keeps one pooled HTTP client until closed."""
+    async def scenario():
+        service_client = ServiceClient()
+        client = service_client._get_client()
+        assert service_client._get_client() is client
+        await service_client.aclose()
+        assert client.is_closed
+        assert service_client._get_client() is not client
+        await service_client.aclose()
+    
+    asyncio.run(scenario())
+
+def test_health_checks_are_cached_until_invalidated():
+    """Test repeated health checks within the TTL reuse the first result."""
+    async def scenario():
+        service_client = ServiceClient()
+        service_client.resource_scanner_url = 'http://scanner.test'
+        calls = []
+        
+        async def get(url, **kwargs):
+            calls.append(url)
+            return httpx.Response(200)
+        
+        service_client._get_client().get = get
+        try:
+            assert await service_client.health_check_scanner() is True
+            assert await service_client.health_check_scanner() is True
+            assert calls == ['http://scanner.test/health']
+            
+            invalidate_health_cache()
+            assert await service_client.health_check_scanner() is True
+            assert len(calls) == 2
+        finally:
+            invalidate_health_cache()
+            await service_client.aclose()
+    
+    asyncio.run(scenario())
+
+def test_post_json_returns_none_on_error_status():
+    """Test downstream error responses are reported as None."""
+    async def scenario():
+        service_client = ServiceClient()
+        
+        async def post(url, **kwargs):
+            return httpx.Response(503, request=httpx.Request('POST', url))
+        
+        service_client._get_client().post = post
+        try:
+            assert await service_client.scan_all_resources() is None
+            assert await service_client.analyze_costs('123456789012', '2024-01-01', '2024-01-31') is None
+        finally:
+            await service_client.aclose()
+    
+    asyncio.run(scenario())
+
+def test_shutdown_closes_service_clients():
+    """Test the app lifespan closes the routes' pooled service clients."""
+    with patch.object(costs.service_client, 'aclose', new_callable=AsyncMock) as costs_aclose, \
+            patch.object(health.service_client, 'aclose', new_callable=AsyncMock) as health_aclose:
+        with TestClient(app) as client:
+            client.get("/")
+        costs_aclose.assert_awaited_once()
+        health_aclose.assert_awaited_once()
@@ -2,6 +2,7 @@ from flask import Flask, jsonify, request
 from flask_cors import CORS
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Any
 
@@ -11,6 +12,7 @@ import os
 # Add the app directory to Python path so services/models are importable
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
+from config import get_config
 from services.aws_scanner import AWSResourceScanner
 from services.ec2_scanner import EC2Scanner
 from services.rds_scanner import RDSScanner
@@ -30,11 +32,13 @@ CORS(app, resources={r"/*": {"origins": "*"}})
 app.config['JSON_SORT_KEYS'] = False
 app.config['JSONIFY_PRETTYPRINT_REGULAR'] = True
 
+config = get_config()
+
 # Initialize scanners
 aws_scanner = AWSResourceScanner()
 ec2_scanner = EC2Scanner()
 rds_scanner = RDSScanner()
-s3_scanner = S3Scanner()
+s3_scanner = S3Scanner(max_workers=config.S3_SCAN_MAX_WORKERS)
 
 @app.route('/')
 def root() -> Dict[str, str]:
@@ -79,22 +83,24 @@ def scan_all_resources() -> Dict[str, Any]:
             }
         }
         
-        # Scan each service
-        for region in regions:
-            logger.info(f"Scanning region: {region}")
-            
-            # EC2 instances
-            ec2_results = ec2_scanner.scan_instances(region, include_costs)
-            results["services"][f"ec2_{region}"] = ec2_results
-            
-            # RDS instances
-            rds_results = rds_scanner.scan_databases(region, include_costs)
-            results["services"][f"rds_{region}"] = rds_results
+        # Scan each service; all regions are submitted up front so they overlap
+        with ThreadPoolExecutor(max_workers=config.SCAN_MAX_WORKERS) as executor:
+            scans = {}
+            for region in regions:
+                logger.info(f"Scanning region: {region}")
+                
+                # EC2 instances
+                scans[f"ec2_{region}"] = executor.submit(ec2_scanner.scan_instances, region, include_costs)
+                
+                # RDS instances
+                scans[f"rds_{region}"] = executor.submit(rds_scanner.scan_databases, region, include_costs)
+                
+                # S3 buckets (global, but process once)
+                if region == regions[0]:  # Only scan S3 once
+                    scans["s3_global"] = executor.submit(s3_scanner.scan_buckets, include_costs)
             
-            # S3 buckets (global, but process once)
-            if region == regions[0]:  # Only scan S3 once
-                s3_results = s3_scanner.scan_buckets(include_costs)
-                results["services"]["s3_global"] = s3_results
+            for service_key, scan in scans.items():
+                results["services"][service_key] = scan.result()
         
         # Calculate summary
         total_resources = 0
@@ -172,9 +178,10 @@ def scan_s3_resources() -> Dict[str, Any]:
     try:
         data = request.get_json() or {}
         include_costs = data.get('include_costs', True)
+        bucket_name = data.get('bucket_name')
         
         logger.info("Scanning S3 buckets globally")
-        results = s3_scanner.scan_buckets(include_costs)
+        results = s3_scanner.scan_buckets(include_costs, bucket_filter=bucket_name)
         
         return jsonify({
             "scan_type": "s3",
@@ -27,6 +27,10 @@ class Config:
     # Scan Settings
     DEFAULT_SCAN_REGIONS = os.getenv("DEFAULT_SCAN_REGIONS", "us-west-2,us-east-1").split(",")
     SCAN_TIMEOUT_SECONDS = int(os.getenv("SCAN_TIMEOUT_SECONDS", 300))
+    # Threads for the per-region service scans in /scan/all
+    SCAN_MAX_WORKERS = int(os.getenv("SCAN_MAX_WORKERS", 8))
+    # Threads for S3 bucket metadata calls; lower to stay under S3 request-rate limits
+    S3_SCAN_MAX_WORKERS = int(os.getenv("S3_SCAN_MAX_WORKERS", 32))
 
     # Logging
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
@@ -1,16 +1,58 @@
 import boto3
 import logging
+import threading
+from botocore.config import Config
+from botocore.exceptions import ClientError
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 
 logger = logging.getLogger(__name__)
 
+# Shared client configuration: larger keep-alive pool for concurrent scans
+# and adaptive retries so throttled calls back off instead of failing
+BOTO_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={'max_attempts': 5, 'mode': 'adaptive'},
+    connect_timeout=3,
+    read_timeout=10
+)
+
+# Approximate billing hours in a month
+HOURS_PER_MONTH = 24 * 30
+
+# Mock hourly pricing data (in production, use AWS Pricing API)
+PRICING_DATA = {
+    "ec2": {
+        "t3.micro": 0.0104,
+        "t3.small": 0.0208,
+        "t3.medium": 0.0416,
+        "t3.large": 0.0832,
+        "t3.xlarge": 0.1664,
+        "m5.large": 0.096,
+        "m5.xlarge": 0.192,
+        "m5.2xlarge": 0.384
+    },
+    "rds": {
+        "db.t3.micro": 0.017,
+        "db.t3.small": 0.034,
+        "db.t3.medium": 0.068,
+        "db.t3.large": 0.136,
+        "db.m5.large": 0.192,
+        "db.m5.xlarge": 0.384
+    }
+}
+
+
 class AWSResourceScanner:
     """Base class for AWS resource scanning."""
     
     def __init__(self):
         """Initialize AWS scanner with default configuration."""
         self.session = None
+        self._clients: Dict[tuple, Any] = {}
+        # boto3 Sessions are not thread-safe; scans create clients from workers
+        self._client_lock = threading.Lock()
         self._initialize_session()
     
     def _initialize_session(self):
@@ -24,47 +66,40 @@ class AWSResourceScanner:
             self.session = None
     
     def get_client(self, service_name: str, region: str = 'us-west-2'):
-        """Get AWS service client for specified region."""
+        """Get AWS service client for specified region.
+        
+        Real clients are cached per (service, region) so repeated scans reuse
+        the same client and its connection pool. Creation is serialized because
+        the shared boto3 Session is not thread-safe; the clients themselves are.
+        """
         if not self.session:
             logger.warning("AWS session not available, returning mock client")
             return MockAWSClient(service_name)
         
+        key = (service_name, region)
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+        
         try:
-            return self.session.client(service_name, region_name=region)
+            with self._client_lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self._clients[key] = self.session.client(
+                        service_name, region_name=region, config=BOTO_CLIENT_CONFIG
+                    )
+            return client
         except Exception as e:
             logger.warning(f"Failed to create {service_name} client: {e}")
             return MockAWSClient(service_name)
     
     def calculate_monthly_cost(self, hourly_cost: float) -> float:
         """Calculate monthly cost from hourly cost."""
-        hours_per_month = 24 * 30  # Approximate
-        return round(hourly_cost * hours_per_month, 2)
+        return round(hourly_cost * HOURS_PER_MONTH, 2)
     
     def get_cost_estimate(self, instance_type: str, service_type: str = "ec2") -> float:
         """Get cost estimate for instance type."""
-        # Mock pricing data (in production, use AWS Pricing API)
-        pricing_data = {
-            "ec2": {
-                "t3.micro": 0.0104,
-                "t3.small": 0.0208,
-                "t3.medium": 0.0416,
-                "t3.large": 0.0832,
-                "t3.xlarge": 0.1664,
-                "m5.large": 0.096,
-                "m5.xlarge": 0.192,
-                "m5.2xlarge": 0.384
-            },
-            "rds": {
-                "db.t3.micro": 0.017,
-                "db.t3.small": 0.034,
-                "db.t3.medium": 0.068,
-                "db.t3.large": 0.136,
-                "db.m5.large": 0.192,
-                "db.m5.xlarge": 0.384
-            }
-        }
-        
-        return pricing_data.get(service_type, {}).get(instance_type, 0.05)  # Default fallback
+        return PRICING_DATA.get(service_type, {}).get(instance_type, 0.05)  # Default fallback
 
 
 class MockAWSClient:
@@ -85,12 +120,13 @@ class MockAWSClient:
     
     def _mock_ec2_data(self):
         """Generate mock EC2 data."""
+        now = datetime.utcnow()
         self.mock_instances = [
             {
                 "InstanceId": "i-1234567890abcdef0",
                 "InstanceType": "t3.medium",
                 "State": {"Name": "running"},
-                "LaunchTime": datetime.utcnow() - timedelta(days=30),
+                "LaunchTime": now - timedelta(days=30),
                 "Tags": [{"Key": "Name", "Value": "Web Server 1"}],
                 "Placement": {"AvailabilityZone": "us-west-2a"},
                 "CpuUtilization": 15.5  # Mock metric
@@ -99,7 +135,7 @@ class MockAWSClient:
                 "InstanceId": "i-0987654321fedcba0",
                 "InstanceType": "t3.large",
                 "State": {"Name": "running"},
-                "LaunchTime": datetime.utcnow() - timedelta(days=5),
+                "LaunchTime": now - timedelta(days=5),
                 "Tags": [{"Key": "Name", "Value": "Database Server"}],
                 "Placement": {"AvailabilityZone": "us-west-2b"},
                 "CpuUtilization": 75.2  # Mock metric
@@ -108,7 +144,7 @@ class MockAWSClient:
                 "InstanceId": "i-abcdef1234567890",
                 "InstanceType": "t3.micro",
                 "State": {"Name": "stopped"},
-                "LaunchTime": datetime.utcnow() - timedelta(days=60),
+                "LaunchTime": now - timedelta(days=60),
                 "Tags": [{"Key": "Name", "Value": "Development Server"}],
                 "Placement": {"AvailabilityZone": "us-west-2a"},
                 "CpuUtilization": 0.0  # Stopped instance
@@ -117,13 +153,14 @@ class MockAWSClient:
     
     def _mock_rds_data(self):
         """Generate mock RDS data."""
+        now = datetime.utcnow()
         self.mock_databases = [
             {
                 "DBInstanceIdentifier": "production-db",
                 "DBInstanceClass": "db.t3.medium",
                 "DBInstanceStatus": "available",
                 "Engine": "postgres",
-                "InstanceCreateTime": datetime.utcnow() - timedelta(days=90),
+                "InstanceCreateTime": now - timedelta(days=90),
                 "AvailabilityZone": "us-west-2a",
                 "MultiAZ": True,
                 "StorageEncrypted": True,
@@ -135,7 +172,7 @@ class MockAWSClient:
                 "DBInstanceClass": "db.t3.small",
                 "DBInstanceStatus": "available",
                 "Engine": "mysql",
-                "InstanceCreateTime": datetime.utcnow() - timedelta(days=30),
+                "InstanceCreateTime": now - timedelta(days=30),
                 "AvailabilityZone": "us-west-2b",
                 "MultiAZ": False,
                 "StorageEncrypted": False,
@@ -146,24 +183,25 @@ class MockAWSClient:
     
     def _mock_s3_data(self):
         """Generate mock S3 data."""
+        now = datetime.utcnow()
         self.mock_buckets = [
             {
                 "Name": "costwatch-prod-data",
-                "CreationDate": datetime.utcnow() - timedelta(days=365),
+                "CreationDate": now - timedelta(days=365),
                 "Size": 1024 * 1024 * 1024 * 50,  # 50 GB
                 "ObjectCount": 10000,
                 "StorageClass": "STANDARD"
             },
             {
                 "Name": "costwatch-logs-archive",
-                "CreationDate": datetime.utcnow() - timedelta(days=180),
+                "CreationDate": now - timedelta(days=180),
                 "Size": 1024 * 1024 * 1024 * 200,  # 200 GB
                 "ObjectCount": 50000,
                 "StorageClass": "GLACIER"
             },
             {
                 "Name": "costwatch-temp-uploads",
-                "CreationDate": datetime.utcnow() - timedelta(days=7),
+                "CreationDate": now - timedelta(days=7),
                 "Size": 1024 * 1024 * 100,  # 100 MB
                 "ObjectCount": 50,
                 "StorageClass": "STANDARD"
@@ -184,4 +222,25 @@ class MockAWSClient:
     
     def list_buckets(self, **kwargs):
         """Mock S3 list_buckets."""
-        return {"Buckets": self.mock_buckets}
\ No newline at end of file
+        return {"Buckets": self.mock_buckets}
+    
+    def head_bucket(self, Bucket: str, **kwargs):
+        """Mock S3 head_bucket."""
+        if not any(bucket["Name"] == Bucket for bucket in self.mock_buckets):
+            raise ClientError({"Error": {"Code": "404", "Message": "Not Found"}}, "HeadBucket")
+        return {}
+    
+    def get_paginator(self, operation_name: str):
+        """Mock get_paginator; serves the whole mock result as one page."""
+        return MockPaginator(getattr(self, operation_name))
+
+
+class MockPaginator:
+    """Mock boto3 paginator for development/demo purposes."""
+    
+    def __init__(self, operation):
+        self.operation = operation
+    
+    def paginate(self, **kwargs):
+        """Mock paginate yielding a single page."""
+        return iter([self.operation(**kwargs)])
\ No newline at end of file
@@ -1,11 +1,70 @@
 import logging
-from typing import Dict, List, Any
+import re
+from copy import deepcopy
+from itertools import chain
+from random import uniform
+from typing import Dict, List, Any, Tuple
 from datetime import datetime
 
-from .aws_scanner import AWSResourceScanner
+from .aws_scanner import AWSResourceScanner, HOURS_PER_MONTH
 
 logger = logging.getLogger(__name__)
 
+# Identifiers matching this are treated as production databases
+_PROD_RE = re.compile(r'prod', re.IGNORECASE)
+
+# General RDS recommendations; static, so built once at import
+_STATIC_RECOMMENDATIONS = (
+    {
+        "category": "Instance Right-sizing",
+        "description": "Optimize RDS instance classes based on actual usage patterns",
+        "potential_savings": "25-50%",
+        "implementation_effort": "Medium",
+        "best_practices": [
+            "Monitor CloudWatch metrics for CPU, memory, and IOPS",
+            "Analyze connection patterns and query performance",
+            "Consider burstable instance types for variable workloads",
+            "Test performance after downsizing"
+        ]
+    },
+    {
+        "category": "Reserved Instances",
+        "description": "Purchase RDS Reserved Instances for steady-state workloads",
+        "potential_savings": "30-60%",
+        "implementation_effort": "Low",
+        "best_practices": [
+            "Analyze usage patterns over 6-12 months",
+            "Start with 1-year terms for flexibility",
+            "Consider size-flexible RIs",
+            "Monitor RI utilization regularly"
+        ]
+    },
+    {
+        "category": "Storage Optimization",
+        "description": "Optimize storage type and allocation",
+        "potential_savings": "20-40%",
+        "implementation_effort": "Low",
+        "best_practices": [
+            "Use GP3 storage for better price/performance",
+            "Monitor storage utilization and right-size",
+            "Enable storage autoscaling where appropriate",
+            "Consider archiving old data"
+        ]
+    },
+    {
+        "category": "Automated Backups",
+        "description": "Optimize backup retention and scheduling",
+        "potential_savings": "10-30%",
+        "implementation_effort": "Low",
+        "best_practices": [
+            "Set appropriate backup retention periods",
+            "Use automated backup windows during low-usage periods",
+            "Consider cross-region backup only when necessary",
+            "Implement lifecycle policies for snapshots"
+        ]
+    }
+)
+
 class RDSScanner(AWSResourceScanner):
     """Scanner for RDS instances and related resources."""
     
@@ -14,23 +73,21 @@ class RDSScanner(AWSResourceScanner):
         try:
             rds_client = self.get_client('rds', region)
             
-            # Get RDS instances
-            response = rds_client.describe_db_instances()
+            # Get RDS instances; a single call stops at the first page
+            paginator = rds_client.get_paginator('describe_db_instances')
+            db_instances = [
+                db_instance
+                for page in paginator.paginate(PaginationConfig={'PageSize': 100})
+                for db_instance in page.get('DBInstances', [])
+            ]
             
-            databases = []
-            total_cost = 0.0
-            optimization_opportunities = []
+            processed = [self._process_database(db_instance, include_costs) for db_instance in db_instances]
             
-            for db_instance in response.get('DBInstances', []):
-                db_data = self._process_database(db_instance, include_costs)
-                databases.append(db_data)
-                
-                if include_costs:
-                    total_cost += db_data.get('estimated_monthly_cost', 0.0)
-                
-                # Check for optimization opportunities
-                opportunities = self._analyze_database_optimization(db_data)
-                optimization_opportunities.extend(opportunities)
+            databases = [db_data for db_data, _, _ in processed]
+            total_cost = sum(monthly_cost for _, monthly_cost, _ in processed)
+            optimization_opportunities = list(chain.from_iterable(
+                opportunities for _, _, opportunities in processed
+            ))
             
             result = {
                 "databases": databases,
@@ -47,8 +104,13 @@ class RDSScanner(AWSResourceScanner):
             logger.error(f"Error scanning RDS instances: {e}")
             raise
     
-    def _process_database(self, db_instance: Dict[str, Any], include_costs: bool = True) -> Dict[str, Any]:
-        """Process individual RDS instance data."""
+    def _process_database(self, db_instance: Dict[str, Any],
+                          include_costs: bool = True) -> Tuple[Dict[str, Any], float, List[Dict[str, Any]]]:
+        """Process individual RDS instance data.
+        
+        Returns the processed record, its monthly cost and its optimization
+        opportunities, so each database is handled in a single pass.
+        """
         db_identifier = db_instance.get('DBInstanceIdentifier', 'unknown')
         db_class = db_instance.get('DBInstanceClass', 'unknown')
         status = db_instance.get('DBInstanceStatus', 'unknown')
@@ -57,8 +119,9 @@ class RDSScanner(AWSResourceScanner):
         # Calculate costs
         estimated_monthly_cost = 0.0
         if include_costs and status == 'available':
+            # Keep the instance cost unrounded until storage is added
             hourly_cost = self.get_cost_estimate(db_class, 'rds')
-            estimated_monthly_cost = self.calculate_monthly_cost(hourly_cost)
+            estimated_monthly_cost = hourly_cost * HOURS_PER_MONTH
             
             # Add storage costs
             allocated_storage = db_instance.get('AllocatedStorage', 0)
@@ -85,12 +148,11 @@ class RDSScanner(AWSResourceScanner):
         else:
             # Mock CPU utilization
             if status == 'available':
-                import random
-                processed_db['cpu_utilization'] = round(random.uniform(10, 80), 1)
+                processed_db['cpu_utilization'] = round(uniform(10, 80), 1)
             else:
                 processed_db['cpu_utilization'] = 0.0
         
-        return processed_db
+        return processed_db, estimated_monthly_cost, self._analyze_database_optimization(processed_db)
     
     def _analyze_database_optimization(self, db_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Analyze database for optimization opportunities."""
@@ -125,7 +187,7 @@ class RDSScanner(AWSResourceScanner):
             })
         
         # Check for single-AZ production databases
-        if not db_data.get('multi_az', False) and 'prod' in db_data['db_identifier'].lower():
+        if not db_data.get('multi_az', False) and _PROD_RE.search(db_data['db_identifier']):
             opportunities.append({
                 "type": "availability_improvement",
                 "resource_id": db_data['db_identifier'],
@@ -153,53 +215,5 @@ class RDSScanner(AWSResourceScanner):
     
     def get_optimization_recommendations(self) -> List[Dict[str, Any]]:
         """Get general RDS optimization recommendations."""
-        return [
-            {
-                "category": "Instance Right-sizing",
-                "description": "Optimize RDS instance classes based on actual usage patterns",
-                "potential_savings": "25-50%",
-                "implementation_effort": "Medium",
-                "best_practices": [
-                    "Monitor CloudWatch metrics for CPU, memory, and IOPS",
-                    "Analyze connection patterns and query performance",
-                    "Consider burstable instance types for variable workloads",
-                    "Test performance after downsizing"
-                ]
-            },
-            {
-                "category": "Reserved Instances",
-                "description": "Purchase RDS Reserved Instances for steady-state workloads",
-                "potential_savings": "30-60%",
-                "implementation_effort": "Low",
-                "best_practices": [
-                    "Analyze usage patterns over 6-12 months",
-                    "Start with 1-year terms for flexibility",
-                    "Consider size-flexible RIs",
-                    "Monitor RI utilization regularly"
-                ]
-            },
-            {
-                "category": "Storage Optimization",
-                "description": "Optimize storage type and allocation",
-                "potential_savings": "20-40%",
-                "implementation_effort": "Low",
-                "best_practices": [
-                    "Use GP3 storage for better price/performance",
-                    "Monitor storage utilization and right-size",
-                    "Enable storage autoscaling where appropriate",
-                    "Consider archiving old data"
-                ]
-            },
-            {
-                "category": "Automated Backups",
-                "description": "Optimize backup retention and scheduling",
-                "potential_savings": "10-30%",
-                "implementation_effort": "Low",
-                "best_practices": [
-                    "Set appropriate backup retention periods",
-                    "Use automated backup windows during low-usage periods",
-                    "Consider cross-region backup only when necessary",
-                    "Implement lifecycle policies for snapshots"
-                ]
-            }
-        ]
\ No newline at end of file
+        return list(deepcopy(_STATIC_RECOMMENDATIONS))
+
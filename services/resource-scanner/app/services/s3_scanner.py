@@ -1,38 +1,103 @@
 import boto3
 import logging
-from typing import Dict, List, Any
-from datetime import datetime
+from copy import deepcopy
+from dataclasses import dataclass, asdict
+from botocore.exceptions import ClientError
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import chain
+from typing import Dict, List, Any, Optional, Tuple
+from datetime import datetime, timedelta
 import os
 
 from .aws_scanner import AWSResourceScanner
 
 logger = logging.getLogger(__name__)
 
+# Bucket metadata calls are network-bound, so fan them out across threads.
+# The service passes Config.S3_SCAN_MAX_WORKERS; this is the default.
+DEFAULT_MAX_BUCKET_WORKERS = 32
+
+# S3 publishes bucket storage metrics to CloudWatch once a day
+STORAGE_METRIC_PERIOD = 86400
+STORAGE_METRIC_LOOKBACK = timedelta(days=3)
+
+# S3 storage pricing per GB/month by storage class (simplified)
+S3_COST_PER_GB = {
+    'STANDARD': 0.023,
+    'GLACIER': 0.004,
+    'DEEP_ARCHIVE': 0.00099
+}
+DEFAULT_COST_PER_GB = S3_COST_PER_GB['STANDARD']
+REQUEST_COST = 0.0004 / 1000  # $0.0004 per 1,000 requests
+
+# General S3 recommendations; static, so built once at import
+_STATIC_RECOMMENDATIONS = (
+    {
+        "category": "Storage Class Optimization",
+        "description": "Use appropriate storage classes for different access patterns",
+        "potential_savings": "40-80%",
+        "implementation_effort": "Low",
+        "best_practices": [
+            "Use S3 Intelligent-Tiering for unknown access patterns",
+            "Transition infrequently accessed data to IA after 30 days",
+            "Archive old data to Glacier or Deep Archive"
+        ]
+    },
+)
+
+
+@dataclass(slots=True)
+class BucketRecord:
+    """Normalized S3 bucket data produced during a scan."""
+    bucket_name: str
+    creation_date: Optional[str]
+    region: str
+    size_gb: float
+    object_count: int
+    storage_class: str
+    estimated_monthly_cost: Optional[float]
+    has_lifecycle_policy: bool
+    versioning_enabled: bool
+    encryption_enabled: bool
+
+
 class S3Scanner(AWSResourceScanner):
     """Scanner for S3 buckets and storage optimization."""
     
-    def scan_buckets(self, include_costs: bool = True) -> Dict[str, Any]:
-        """Scan S3 buckets globally."""
+    def __init__(self, max_workers: int = DEFAULT_MAX_BUCKET_WORKERS):
+        super().__init__()
+        self.max_workers = max_workers
+    
+    def scan_buckets(self, include_costs: bool = True, bucket_filter: Optional[str] = None) -> Dict[str, Any]:
+        """Scan S3 buckets globally, or only the bucket named by bucket_filter."""
         try:
             s3_client = self.get_client('s3', 'us-east-1')  # S3 is global
             
-            # Get real buckets from AWS
-            response = s3_client.list_buckets()
+            if bucket_filter:
+                # A single HEAD request instead of listing every bucket
+                raw_buckets = [{'Name': bucket_filter}] if self.bucket_exists(bucket_filter) else []
+            else:
+                # Get real buckets from AWS
+                response = s3_client.list_buckets()
+                raw_buckets = response.get('Buckets', [])
             
-            buckets = []
-            total_cost = 0.0
-            optimization_opportunities = []
+            # boto3 clients are thread-safe, so workers share s3_client. All
+            # metadata calls for all buckets are queued up front so they overlap.
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                bucket_metadata = [
+                    self._fetch_bucket_metadata(executor, s3_client, bucket.get('Name', 'unknown'))
+                    for bucket in raw_buckets
+                ]
+                processed_buckets = [
+                    self._process_bucket(bucket, metadata, include_costs)
+                    for bucket, metadata in zip(raw_buckets, bucket_metadata)
+                ]
             
-            for bucket in response.get('Buckets', []):
-                bucket_data = self._process_bucket(bucket, s3_client, include_costs)
-                buckets.append(bucket_data)
-                
-                if include_costs:
-                    total_cost += bucket_data.get('estimated_monthly_cost', 0.0)
-                
-                # Check for optimization opportunities
-                opportunities = self._analyze_bucket_optimization(bucket_data)
-                optimization_opportunities.extend(opportunities)
+            buckets = [asdict(bucket_data) for bucket_data, _, _ in processed_buckets]
+            total_cost = sum(monthly_cost for _, monthly_cost, _ in processed_buckets)
+            optimization_opportunities = list(chain.from_iterable(
+                opportunities for _, _, opportunities in processed_buckets
+            ))
             
             result = {
                 "resources": buckets,  # Changed from "buckets" to match your Flask app
@@ -56,42 +121,129 @@ class S3Scanner(AWSResourceScanner):
                 "error": str(e)
             }
     
-    def _process_bucket(self, bucket: Dict[str, Any], s3_client, include_costs: bool = True) -> Dict[str, Any]:
-        """Process individual S3 bucket data with real AWS data."""
+    def bucket_exists(self, bucket_name: str) -> bool:
+        """Check whether a bucket exists with a single HEAD request."""
+        try:
+            self.get_client('s3', 'us-east-1').head_bucket(Bucket=bucket_name)
+            return True
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchBucket', 'NotFound'):
+                return False
+            raise
+    
+    def _fetch_bucket_metadata(self, executor: ThreadPoolExecutor, s3_client,
+                               bucket_name: str) -> Dict[str, Future]:
+        """Submit the metadata calls for a bucket and return their futures."""
+        return {
+            "region": executor.submit(self._get_bucket_region, s3_client, bucket_name),
+            "versioning_enabled": executor.submit(self._get_versioning_enabled, s3_client, bucket_name),
+            "encryption_enabled": executor.submit(self._get_encryption_enabled, s3_client, bucket_name),
+            "has_lifecycle_policy": executor.submit(self._has_lifecycle_policy, s3_client, bucket_name),
+            "usage": executor.submit(self._get_bucket_usage, s3_client, bucket_name)
+        }
+    
+    def _get_bucket_region(self, s3_client, bucket_name: str) -> str:
+        """Get bucket location."""
+        location_response = s3_client.get_bucket_location(Bucket=bucket_name)
+        return location_response.get('LocationConstraint') or 'us-east-1'
+    
+    def _get_versioning_enabled(self, s3_client, bucket_name: str) -> bool:
+        """Get bucket versioning status."""
+        try:
+            versioning_response = s3_client.get_bucket_versioning(Bucket=bucket_name)
+            return versioning_response.get('Status') == 'Enabled'
+        except ClientError as e:
+            logger.warning(f"Could not get versioning for bucket {bucket_name}: {e}")
+            return False
+    
+    def _get_encryption_enabled(self, s3_client, bucket_name: str) -> bool:
+        """Get bucket encryption status; a missing configuration is reported as an error."""
+        try:
+            s3_client.get_bucket_encryption(Bucket=bucket_name)
+            return True
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') != 'ServerSideEncryptionConfigurationNotFoundError':
+                logger.warning(f"Could not get encryption for bucket {bucket_name}: {e}")
+            return False
+    
+    def _has_lifecycle_policy(self, s3_client, bucket_name: str) -> bool:
+        """Get lifecycle policy status."""
+        try:
+            s3_client.get_bucket_lifecycle_configuration(Bucket=bucket_name)
+            return True
+        except ClientError as e:
+            if e.response.get('Error', {}).get('Code') != 'NoSuchLifecycleConfiguration':
+                logger.warning(f"Could not get lifecycle policy for bucket {bucket_name}: {e}")
+            return False
+    
+    def _get_bucket_usage(self, s3_client, bucket_name: str) -> Tuple[float, int]:
+        """Get bucket size in GB and object count from S3's daily CloudWatch storage metrics.
+        
+        The metric reads per bucket depend on how many storage classes it
+        uses, not on how many objects it holds. The region is looked up here
+        rather than taken from the region task, so no pool task waits on another.
+        """
+        region = self._get_bucket_region(s3_client, bucket_name)
+        cloudwatch = self.get_client('cloudwatch', region)
+        size_bytes = sum(
+            self._get_storage_metric(cloudwatch, bucket_name, 'BucketSizeBytes', storage_type)
+            for storage_type in self._get_storage_types(cloudwatch, bucket_name)
+        )
+        object_count = self._get_storage_metric(cloudwatch, bucket_name, 'NumberOfObjects', 'AllStorageTypes')
+        return size_bytes / (1024 ** 3), int(object_count)
+    
+    def _get_storage_types(self, cloudwatch, bucket_name: str) -> List[str]:
+        """Get the storage types (StandardStorage, GlacierStorage, ...) a bucket publishes BucketSizeBytes for."""
+        response = cloudwatch.list_metrics(
+            Namespace='AWS/S3',
+            MetricName='BucketSizeBytes',
+            Dimensions=[{'Name': 'BucketName', 'Value': bucket_name}]
+        )
+        return [
+            dimension['Value']
+            for metric in response.get('Metrics', [])
+            for dimension in metric.get('Dimensions', [])
+            if dimension.get('Name') == 'StorageType'
+        ]
+    
+    def _get_storage_metric(self, cloudwatch, bucket_name: str, metric_name: str, storage_type: str) -> float:
+        """Get the latest daily value of an S3 storage metric, or 0 if none is published yet."""
+        end_time = datetime.utcnow()
+        response = cloudwatch.get_metric_statistics(
+            Namespace='AWS/S3',
+            MetricName=metric_name,
+            Dimensions=[
+                {'Name': 'BucketName', 'Value': bucket_name},
+                {'Name': 'StorageType', 'Value': storage_type}
+            ],
+            StartTime=end_time - STORAGE_METRIC_LOOKBACK,
+            EndTime=end_time,
+            Period=STORAGE_METRIC_PERIOD,
+            Statistics=['Average']
+        )
+        datapoints = response.get('Datapoints', [])
+        if not datapoints:
+            return 0.0
+        return max(datapoints, key=lambda point: point['Timestamp'])['Average']
+    
+    def _process_bucket(self, bucket: Dict[str, Any], metadata: Dict[str, Future],
+                        include_costs: bool = True) -> Tuple[BucketRecord, float, List[Dict[str, Any]]]:
+        """Process individual S3 bucket data with real AWS data.
+        
+        Returns the processed record, its monthly cost and its optimization
+        opportunities, so each bucket is handled in a single pass.
+        """
         bucket_name = bucket.get('Name', 'unknown')
-        creation_date = bucket.get('CreationDate', datetime.utcnow())
+        storage_class = bucket.get('StorageClass', 'STANDARD')  # Would need CloudWatch for real data
+        # None for buckets looked up with HeadBucket, which returns no creation date
+        creation_date = bucket.get('CreationDate')
         
-        # Get real bucket information
+        # Collect real bucket information fetched by _fetch_bucket_metadata
         try:
-            # Get bucket location
-            location_response = s3_client.get_bucket_location(Bucket=bucket_name)
-            region = location_response.get('LocationConstraint') or 'us-east-1'
-            
-            # Get bucket versioning status
-            try:
-                versioning_response = s3_client.get_bucket_versioning(Bucket=bucket_name)
-                versioning_enabled = versioning_response.get('Status') == 'Enabled'
-            except:
-                versioning_enabled = False
-            
-            # Get bucket encryption status
-            try:
-                s3_client.get_bucket_encryption(Bucket=bucket_name)
-                encryption_enabled = True
-            except:
-                encryption_enabled = False
-            
-            # Get lifecycle policy status
-            try:
-                s3_client.get_bucket_lifecycle_configuration(Bucket=bucket_name)
-                has_lifecycle_policy = True
-            except:
-                has_lifecycle_policy = False
-            
-            # For now, use estimated size and object count (getting real metrics requires CloudWatch)
-            # In production, you'd use CloudWatch metrics or S3 Inventory
-            size_gb = 5.5  # Default estimate
-            object_count = 100  # Default estimate
+            region = metadata['region'].result()
+            versioning_enabled = metadata['versioning_enabled'].result()
+            encryption_enabled = metadata['encryption_enabled'].result()
+            has_lifecycle_policy = metadata['has_lifecycle_policy'].result()
             
         except Exception as e:
             logger.warning(f"Could not get detailed info for bucket {bucket_name}: {e}")
@@ -99,55 +251,61 @@ class S3Scanner(AWSResourceScanner):
             versioning_enabled = False
             encryption_enabled = False
             has_lifecycle_policy = False
+        
+        # Usage comes from CloudWatch, so a metrics failure keeps the bucket metadata above
+        try:
+            size_gb, object_count = metadata['usage'].result()
+            
+        except Exception as e:
+            logger.warning(f"Could not get storage metrics for bucket {bucket_name}: {e}")
             size_gb = 1.0
             object_count = 10
         
         # Calculate estimated costs
         estimated_monthly_cost = 0.0
         if include_costs:
-            # S3 Standard storage pricing (simplified)
-            cost_per_gb = 0.023  # $0.023 per GB/month for Standard
+            cost_per_gb = S3_COST_PER_GB.get(storage_class, DEFAULT_COST_PER_GB)
             estimated_monthly_cost = size_gb * cost_per_gb
             
             # Add request costs (simplified)
-            request_cost = object_count * 0.0004 / 1000  # $0.0004 per 1,000 requests
-            estimated_monthly_cost += request_cost
+            estimated_monthly_cost += object_count * REQUEST_COST
         
-        processed_bucket = {
-            "bucket_name": bucket_name,
-            "creation_date": creation_date.isoformat(),
-            "region": region,
-            "size_gb": round(size_gb, 2),
-            "object_count": object_count,
-            "storage_class": "STANDARD",  # Default, would need CloudWatch for real data
-            "estimated_monthly_cost": round(estimated_monthly_cost, 2) if include_costs else None,
-            "has_lifecycle_policy": has_lifecycle_policy,
-            "versioning_enabled": versioning_enabled,
-            "encryption_enabled": encryption_enabled
-        }
+        processed_bucket = BucketRecord(
+            bucket_name=bucket_name,
+            creation_date=creation_date.isoformat() if creation_date else None,
+            region=region,
+            size_gb=round(size_gb, 2),
+            object_count=object_count,
+            storage_class=storage_class,
+            estimated_monthly_cost=round(estimated_monthly_cost, 2) if include_costs else None,
+            has_lifecycle_policy=has_lifecycle_policy,
+            versioning_enabled=versioning_enabled,
+            encryption_enabled=encryption_enabled
+        )
         
-        return processed_bucket
+        return processed_bucket, estimated_monthly_cost, self._analyze_bucket_optimization(processed_bucket)
     
-    def _analyze_bucket_optimization(self, bucket_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _analyze_bucket_optimization(self, bucket_data: BucketRecord) -> List[Dict[str, Any]]:
         """Analyze bucket for optimization opportunities."""
         opportunities = []
         
-        bucket_name = bucket_data['bucket_name']
-        size_gb = bucket_data.get('size_gb', 0)
+        bucket_name = bucket_data.bucket_name
+        # None when the scan was run without costs
+        estimated_cost = bucket_data.estimated_monthly_cost or 0
         
         # Check for lifecycle policy
-        if not bucket_data.get('has_lifecycle_policy', False) and size_gb > 1:
+        if not bucket_data.has_lifecycle_policy and bucket_data.size_gb > 1:
             opportunities.append({
                 "type": "lifecycle_optimization",
                 "resource_id": bucket_name,
                 "recommendation": "Implement lifecycle policies to automatically transition objects to cheaper storage classes.",
-                "potential_savings": bucket_data.get('estimated_monthly_cost', 0) * 0.6,
+                "potential_savings": estimated_cost * 0.6,
                 "priority": "high",
                 "effort": "low"
             })
         
         # Check for unencrypted buckets
-        if not bucket_data.get('encryption_enabled', False):
+        if not bucket_data.encryption_enabled:
             opportunities.append({
                 "type": "security_improvement",
                 "resource_id": bucket_name,
@@ -162,16 +320,5 @@ class S3Scanner(AWSResourceScanner):
     
     def get_optimization_recommendations(self) -> List[Dict[str, Any]]:
         """Get general S3 optimization recommendations."""
-        return [
-            {
-                "category": "Storage Class Optimization",
-                "description": "Use appropriate storage classes for different access patterns",
-                "potential_savings": "40-80%",
-                "implementation_effort": "Low",
-                "best_practices": [
-                    "Use S3 Intelligent-Tiering for unknown access patterns",
-                    "Transition infrequently accessed data to IA after 30 days",
-                    "Archive old data to Glacier or Deep Archive"
-                ]
-            }
-        ]
\ No newline at end of file
+        return list(deepcopy(_STATIC_RECOMMENDATIONS))
+
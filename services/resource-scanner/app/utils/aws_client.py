@@ -1,10 +1,22 @@
 import boto3
 import logging
-from typing import Dict, List, Any
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from typing import Dict, List, Any, Optional
 import os
 
 logger = logging.getLogger(__name__)
 
+# Same settings as the scanners' BOTO_CLIENT_CONFIG: keep-alive pool for
+# concurrent calls and adaptive retries so throttled calls back off
+AWS_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={'max_attempts': 5, 'mode': 'adaptive'},
+    connect_timeout=3,
+    read_timeout=10
+)
+
 class AWSClient:
     def __init__(self):
         """Initialize AWS client with credentials from environment variables."""
@@ -18,9 +30,10 @@ class AWSClient:
                 aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
                 region_name=self.region
             )
+            self._clients: Dict[tuple, Any] = {}
             
             # Test connection
-            sts = self.session.client('sts')
+            sts = self.client('sts')
             identity = sts.get_caller_identity()
             logger.info(f"Connected to AWS account: {identity['Account']}")
             
@@ -28,10 +41,20 @@ class AWSClient:
             logger.error(f"Failed to initialize AWS client: {e}")
             raise
     
+    def client(self, service_name: str, region: Optional[str] = None):
+        """Get a boto3 client, reusing the one already created for (service, region)."""
+        key = (service_name, region or self.region)
+        client = self._clients.get(key)
+        if client is None:
+            client = self._clients[key] = self.session.client(
+                service_name, region_name=key[1], config=AWS_CLIENT_CONFIG
+            )
+        return client
+    
     def list_ec2_instances(self) -> List[Dict[str, Any]]:
         """List EC2 instances in the current region."""
         try:
-            ec2 = self.session.client('ec2')
+            ec2 = self.client('ec2')
             
             response = ec2.describe_instances()
             instances = []
@@ -56,10 +79,24 @@ class AWSClient:
             logger.error(f"Failed to list EC2 instances: {e}")
             return []
 
-    def list_s3_buckets(self) -> List[Dict[str, Any]]:
-        """List S3 buckets."""
+    def list_s3_buckets(self, bucket_name: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List S3 buckets, or only bucket_name if it exists."""
         try:
-            s3 = self.session.client('s3')
+            s3 = self.client('s3')
+            
+            if bucket_name:
+                # A single HEAD request instead of listing every bucket
+                try:
+                    s3.head_bucket(Bucket=bucket_name)
+                except ClientError as e:
+                    if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchBucket', 'NotFound'):
+                        return []
+                    raise
+                return [{
+                    'bucket_name': bucket_name,
+                    'creation_date': None,  # Not returned by HeadBucket
+                    'region': self.region
+                }]
             
             response = s3.list_buckets()
             buckets = []
@@ -82,7 +119,7 @@ class AWSClient:
     def test_connection(self) -> bool:
         """Test AWS connection."""
         try:
-            sts = self.session.client('sts')
+            sts = self.client('sts')
             sts.get_caller_identity()
             return True
         except Exception as e:
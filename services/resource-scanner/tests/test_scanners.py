@@ -0,0 +1,168 @@
+import time
+from datetime import datetime
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+from botocore.exceptions import ClientError
+from app.services.aws_scanner import AWSResourceScanner
+from app.services.ec2_scanner import EC2Scanner
+from app.services.rds_scanner import RDSScanner
+from app.services.s3_scanner import S3Scanner
+from app.utils.aws_client import AWSClient, AWS_CLIENT_CONFIG
+
+@pytest.fixture
+def ec2_scanner():
+    """Create EC2 scanner backed by the mock AWS client."""
+    scanner = EC2Scanner()
+    scanner.session = None
+    return scanner
+
+def test_get_client_reuses_clients_per_service_and_region():
+    """Test boto3 clients are cached per (service, region)."""
+    scanner = AWSResourceScanner()
+    s3_client = scanner.get_client('s3', 'us-east-1')
+    assert scanner.get_client('s3', 'us-east-1') is s3_client
+    assert scanner.get_client('s3', 'us-west-2') is not s3_client
+
+def test_get_client_creates_clients_one_at_a_time():
+    """Test concurrent get_client calls never use the boto3 Session at the same time."""
+    scanner = AWSResourceScanner()
+    scanner.session = MagicMock()
+    active = []
+    overlaps = []
+    
+    def create_client(service_name, **kwargs):
+        active.append(service_name)
+        overlaps.append(len(active) > 1)
+        time.sleep(0.01)
+        active.remove(service_name)
+        return MagicMock()
+    
+    scanner.session.client.side_effect = create_client
+    regions = ['us-west-2', 'us-east-1', 'eu-west-1', 'us-west-2']
+    with ThreadPoolExecutor(max_workers=len(regions)) as executor:
+        list(executor.map(lambda region: scanner.get_client('ec2', region), regions))
+    
+    assert not any(overlaps)
+    assert scanner.session.client.call_count == 3
+
+def test_scan_instances_serializes_processed_instances(ec2_scanner):
+    """Test EC2 scan results are returned as plain dictionaries."""
+    result = ec2_scanner.scan_instances('us-west-2', include_costs=True)
+    assert result['total_instances'] == 3
+    instance = result['instances'][0]
+    assert isinstance(instance, dict)
+    assert instance['instance_id'] == 'i-1234567890abcdef0'
+    assert instance['name'] == 'Web Server 1'
+    assert 5 <= instance['cpu_utilization'] <= 85
+
+def test_scan_databases_reads_every_page():
+    """Test RDS scan collects instances from all paginator pages."""
+    rds_client = MagicMock()
+    rds_client.get_paginator.return_value.paginate.return_value = [
+        {"DBInstances": [{"DBInstanceIdentifier": "db-1", "DBInstanceStatus": "available"}]},
+        {"DBInstances": [{"DBInstanceIdentifier": "db-2", "DBInstanceStatus": "stopped"}]}
+    ]
+    
+    with patch.object(RDSScanner, 'get_client', return_value=rds_client):
+        result = RDSScanner().scan_databases('us-west-2', include_costs=True)
+    
+    rds_client.get_paginator.assert_called_once_with('describe_db_instances')
+    assert result['total_databases'] == 2
+    assert [db['db_identifier'] for db in result['databases']] == ['db-1', 'db-2']
+
+def test_scan_buckets_collects_bucket_metadata():
+    """Test S3 scan reads bucket usage from CloudWatch and maps "not found" configuration errors to disabled."""
+    s3_client = MagicMock()
+    s3_client.list_buckets.return_value = {"Buckets": [{"Name": "logs"}]}
+    s3_client.get_bucket_location.return_value = {"LocationConstraint": "eu-west-1"}
+    s3_client.get_bucket_versioning.return_value = {"Status": "Enabled"}
+    s3_client.get_bucket_encryption.side_effect = ClientError(
+        {"Error": {"Code": "ServerSideEncryptionConfigurationNotFoundError"}}, "GetBucketEncryption"
+    )
+    s3_client.get_bucket_lifecycle_configuration.return_value = {"Rules": []}
+    s3_client.list_metrics.return_value = {"Metrics": [
+        {"Dimensions": [{"Name": "BucketName", "Value": "logs"}, {"Name": "StorageType", "Value": "StandardStorage"}]},
+        {"Dimensions": [{"Name": "BucketName", "Value": "logs"}, {"Name": "StorageType", "Value": "GlacierStorage"}]}
+    ]}
+    metrics = {
+        "StandardStorage": [
+            {"Timestamp": datetime(2024, 1, 1), "Average": 1 * 1024 ** 3},
+            {"Timestamp": datetime(2024, 1, 2), "Average": 2 * 1024 ** 3}
+        ],
+        "GlacierStorage": [{"Timestamp": datetime(2024, 1, 2), "Average": 1 * 1024 ** 3}],
+        "AllStorageTypes": [{"Timestamp": datetime(2024, 1, 2), "Average": 3.0}]
+    }
+    s3_client.get_metric_statistics.side_effect = lambda **kwargs: {
+        "Datapoints": metrics[kwargs["Dimensions"][1]["Value"]]
+    }
+    
+    with patch.object(S3Scanner, 'get_client', return_value=s3_client) as get_client:
+        result = S3Scanner().scan_buckets(include_costs=True)
+    
+    get_client.assert_any_call('cloudwatch', 'eu-west-1')
+    s3_client.list_objects_v2.assert_not_called()
+    s3_client.get_paginator.assert_not_called()
+    bucket = result['resources'][0]
+    assert bucket['region'] == 'eu-west-1'
+    assert bucket['versioning_enabled'] is True
+    assert bucket['encryption_enabled'] is False
+    assert bucket['has_lifecycle_policy'] is True
+    assert bucket['size_gb'] == 3.0
+    assert bucket['object_count'] == 3
+
+def test_scan_buckets_keeps_metadata_when_metrics_fail():
+    """Test a CloudWatch failure only falls back the bucket usage."""
+    s3_client = MagicMock()
+    s3_client.list_buckets.return_value = {"Buckets": [{"Name": "logs"}]}
+    s3_client.get_bucket_location.return_value = {"LocationConstraint": "eu-west-1"}
+    s3_client.get_bucket_versioning.return_value = {"Status": "Enabled"}
+    s3_client.list_metrics.side_effect = ClientError({"Error": {"Code": "AccessDenied"}}, "ListMetrics")
+    
+    with patch.object(S3Scanner, 'get_client', return_value=s3_client):
+        result = S3Scanner().scan_buckets(include_costs=True)
+    
+    bucket = result['resources'][0]
+    assert bucket['region'] == 'eu-west-1'
+    assert bucket['versioning_enabled'] is True
+    assert bucket['encryption_enabled'] is True
+    assert bucket['size_gb'] == 1.0
+    assert bucket['object_count'] == 10
+
+def test_optimization_recommendations_are_copies():
+    """Test general recommendations are copies that callers may modify without affecting later calls."""
+    for scanner in (EC2Scanner(), RDSScanner(), S3Scanner()):
+        recommendations = scanner.get_optimization_recommendations()
+        assert isinstance(recommendations, list)
+        assert all('category' in recommendation for recommendation in recommendations)
+        
+        recommendations[0]['category'] = 'changed'
+        recommendations[0]['best_practices'].append('changed')
+        recommendations.clear()
+        fresh = scanner.get_optimization_recommendations()
+        assert fresh
+        assert fresh[0]['category'] != 'changed'
+        assert 'changed' not in fresh[0]['best_practices']
+
+def test_scan_buckets_with_filter_skips_listing():
+    """Test scanning a named bucket uses head_bucket instead of list_buckets and reports no creation date."""
+    scanner = S3Scanner()
+    scanner.session = None
+    
+    result = scanner.scan_buckets(include_costs=True, bucket_filter='costwatch-prod-data')
+    assert [bucket['bucket_name'] for bucket in result['resources']] == ['costwatch-prod-data']
+    assert result['resources'][0]['creation_date'] is None
+    
+    result = scanner.scan_buckets(include_costs=True, bucket_filter='missing-bucket')
+    assert result['resources'] == []
+    assert 'error' not in result
+
+def test_aws_client_caches_configured_clients():
+    """Test AWSClient reuses clients built with the shared botocore config."""
+    with patch('boto3.Session') as session_cls:
+        aws_client = AWSClient()
+        session = session_cls.return_value
+        ec2 = aws_client.client('ec2')
+        assert aws_client.client('ec2') is ec2
+    
+    session.client.assert_any_call('ec2', region_name=aws_client.region, config=AWS_CLIENT_CONFIG)